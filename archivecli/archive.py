@@ -5,8 +5,9 @@ It integrates URL validation, archive service interaction, and browser handling.
 """
 
 from typing import Optional, Tuple
-from .validators import validate_url_with_reachability
+from .validators import ParsedURL, validate_url_with_reachability
 from .archive_service import ArchiveService
+from .http import SESSION
 from .browser_handler import open_url_in_browser
 from .exceptions import (
     URLValidationError,
@@ -20,7 +21,6 @@ from .logging_config import get_logger
 # Module-level logger
 logger = get_logger(__name__)
 
-
 def archive_url(url: str, quiet: bool = False) -> Tuple[bool, str]:
     """Archive a URL using archive.is and open it in the browser.
     
@@ -46,19 +46,21 @@ def archive_url(url: str, quiet: bool = False) -> Tuple[bool, str]:
     """
     try:
         # Validate URL format and reachability
-        logger.info(f"Validating URL: {url}")
-        validate_url_with_reachability(url)
-        
-        # Initialize archive service
-        archive_service = ArchiveService()
+        logger.info("Validating URL: %s", url)
+        validate_url_with_reachability(url, session=SESSION)
         
+        # Reuse the shared archive service
+        archive_service = ArchiveService.instance()
+
         # Get archived version
         logger.info("Retrieving archived version...")
-        archived_url = archive_service.get_latest_archive(url)
+        # Parse once here; the service reuses the precomputed encoding
+        archived_url = archive_service.get_latest_archive(ParsedURL.from_url(url))
         
         # Open in browser
-        logger.info(f"Opening archived URL: {archived_url}")
-        success, message = open_url_in_browser(archived_url)
+        logger.info("Opening archived URL: %s", archived_url)
+        # The archived URL came from archive.is itself, so skip re-validating it
+        success, message = open_url_in_browser(archived_url, trusted=True)
         
         if success:
             return True, f"Successfully opened archived version: {archived_url}"
@@ -66,14 +68,15 @@ def archive_url(url: str, quiet: bool = False) -> Tuple[bool, str]:
             raise BrowserError(f"Failed to open browser: {message}")
             
     except (URLValidationError, URLReachabilityError) as e:
-        logger.error(f"URL error: {str(e)}")
+        logger.error("URL error: %s", str(e))
         return False, str(e)
     except ArchiveServiceError as e:
-        logger.error(f"Archive service error: {str(e)}")
+        logger.error("Archive service error: %s", str(e))
         return False, str(e)
     except BrowserError as e:
-        logger.error(f"Browser error: {str(e)}")
+        logger.error("Browser error: %s", str(e))
         return False, str(e)
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        return False, f"An unexpected error occurred: {str(e)}"
\ No newline at end of file
+    # Every documented error type is handled above (validators and
+    # browser_handler raise the shared classes from .exceptions); anything
+    # else is a genuine bug and should propagate rather than be masked as
+    # a (False, msg) tuple
\ No newline at end of file
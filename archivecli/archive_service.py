@@ -1,9 +1,16 @@
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar, Optional, Union
 import requests
 import logging
-from urllib.parse import urljoin, quote
+from urllib.parse import quote, quote_from_bytes
 from requests.exceptions import RequestException
+from .cache import ArchiveCache
+from .http import SESSION
 from .logging_config import get_logger
+
+if TYPE_CHECKING:
+    from .validators import ParsedURL
 from .exceptions import (
     ArchiveServiceError,
     ArchiveNotFoundError,
@@ -14,40 +21,104 @@ from .exceptions import (
 # Module-level logger
 logger = get_logger(__name__)
 
+# Browser-like headers to avoid blocks; frozen so every service instance
+# shares one mapping instead of rebuilding the dict per instantiation
+_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+})
+
+
+@lru_cache(maxsize=1024)
+def _build_search_url(url: str) -> str:
+    """Build (and memoize) the archive.is search URL for a target URL.
+
+    Args:
+        url: The URL to search for in archive.is
+
+    Returns:
+        str: The complete archive.is search URL
+    """
+    try:
+        # quote_from_bytes is noticeably faster than quote for ASCII URLs
+        encoded_url = quote_from_bytes(url.encode('ascii'), safe=b'')
+    except UnicodeEncodeError:
+        encoded_url = quote(url, safe='')
+    return ArchiveService._SEARCH_PREFIX + encoded_url
+
 
 class ArchiveService:
     """Service class for interacting with archive.is."""
     
     BASE_URL = "https://archive.is/"
     SUBMIT_ENDPOINT = "submit/"
+    # Computed once so building a search URL is a single concatenation
+    _SEARCH_PREFIX = BASE_URL + SUBMIT_ENDPOINT + "?url="
+
+    headers = _HEADERS
+
+    # One session (and so one connection pool) shared by every instance,
+    # created lazily on first use
+    _session: ClassVar[Optional[requests.Session]] = None
+
+    # Cached singleton returned by instance()
+    _instance: ClassVar[Optional["ArchiveService"]] = None
+
+    def __init__(self, cache: Optional[ArchiveCache] = None):
+        # Optional persistent cache of earlier lookups
+        self.cache = cache
+
+    @classmethod
+    def instance(cls) -> "ArchiveService":
+        """Return a shared ArchiveService, creating it on first use.
+
+        Returns:
+            ArchiveService: The cached singleton instance
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Return the shared session, adopting the process-wide one lazily.
+
+        The archive service rides on the process-wide session from
+        archivecli.http, so its lookups share pooled keep-alive
+        connections (and the retry policy) with the URL validator. The
+        session is left untouched — the browser-like headers are passed
+        per request so validator probes don't inherit them.
+
+        Returns:
+            requests.Session: The shared configured session
+        """
+        if cls._session is None:
+            cls._session = SESSION
+        return cls._session
     
-    def __init__(self):
-        # Browser-like headers to avoid blocks
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-        }
-    
-    def construct_search_url(self, url: str) -> str:
+    def construct_search_url(self, url: Union[str, "ParsedURL"]) -> str:
         """Construct the archive.is search URL for a given URL.
         
         Args:
-            url: The URL to search for in archive.is
+            url: The URL to search for in archive.is; either a string or a
+                validators.ParsedURL carrying a precomputed encoding
             
         Returns:
             str: The complete archive.is search URL
         """
-        # URL encode the target URL and construct the search URL
-        encoded_url = quote(url, safe='')
-        return urljoin(self.BASE_URL, f"{self.SUBMIT_ENDPOINT}?url={encoded_url}")
+        encoded = getattr(url, 'encoded_submit', None)
+        if encoded is not None:
+            return self._SEARCH_PREFIX + encoded
+        return _build_search_url(url)
     
-    def get_latest_archive(self, url: str, timeout: int = 10) -> str:
+    def get_latest_archive(self, url: Union[str, "ParsedURL"], timeout: int = 10) -> str:
         """Get the most recent archived version of a URL from archive.is.
         
         Args:
-            url: The URL to find archives for
+            url: The URL to find archives for, as a string or a
+                validators.ParsedURL
             timeout: Request timeout in seconds
             
         Returns:
@@ -57,23 +128,50 @@ class ArchiveService:
             ArchiveServiceError: If there's an error communicating with archive.is
             ArchiveNotFoundError: If no archive is found for the URL
         """
+        raw_url = getattr(url, 'raw', url)
+        if self.cache is not None:
+            cached = self.cache.get(raw_url)
+            if cached is not None:
+                logger.debug("Cache hit for %s: %s", raw_url, cached)
+                return cached
+
         try:
             search_url = self.construct_search_url(url)
-            logger.debug(f"Constructed search URL: {search_url}")
+            logger.debug("Constructed search URL: %s", search_url)
             
-            response = requests.get(
+            # The archive URL is carried in the redirect chain, so a HEAD
+            # is usually enough and skips downloading the response body.
+            session = self._get_session()
+            response = session.head(
                 search_url,
                 headers=self.headers,
                 timeout=timeout,
                 allow_redirects=True
             )
-            logger.debug(f"Received response with status code: {response.status_code}")
+            # Some servers reject HEAD; fall back to a GET for those. Only the
+            # status code and final URL are inspected, so stream=True plus an
+            # immediate close() skips downloading the body. Closing with the
+            # body unread does cost us that connection (urllib3 discards it
+            # rather than reuse it), but skipping the transfer still wins.
+            if response.status_code in (403, 405):
+                logger.debug("HEAD request rejected, falling back to GET")
+                response = session.get(
+                    search_url,
+                    headers=self.headers,
+                    timeout=timeout,
+                    allow_redirects=True,
+                    stream=True
+                )
+                response.close()
+            logger.debug("Received response with status code: %s", response.status_code)
             
             # Check for various response scenarios
             if response.status_code == 200:
                 # If redirected to an archive page, that's the latest archive
                 if 'archive.is/' in response.url and response.url != search_url:
-                    logger.debug(f"Found archive at: {response.url}")
+                    logger.debug("Found archive at: %s", response.url)
+                    if self.cache is not None:
+                        self.cache.put(raw_url, response.url)
                     return response.url
                 
                 # TODO: Implement HTML parsing to extract archive URL if not redirected
@@ -82,15 +180,17 @@ class ArchiveService:
                 raise ArchiveNotFoundError("No archived version found")
                 
             elif response.status_code == 404:
-                logger.warning(f"No archive found for URL: {url}")
+                logger.warning("No archive found for URL: %s", raw_url)
                 raise ArchiveNotFoundError("No archived version found")
             elif response.status_code >= 500:
+                # The adapter's Retry policy has already been exhausted by
+                # the time a 5xx response surfaces here
                 logger.error("Archive.is service returned server error")
                 raise ArchiveServiceUnavailableError(
                     "Archive.is service is temporarily unavailable. Please try again later."
                 )
             else:
-                logger.error(f"Unexpected response status: {response.status_code}")
+                logger.error("Unexpected response status: %s", response.status_code)
                 raise ArchiveServiceError(
                     f"Received unexpected response from archive.is (status code: {response.status_code}). "
                     "Please try again or report this issue if it persists."
@@ -115,7 +215,7 @@ class ArchiveService:
         try:
             return self.get_latest_archive(url, timeout)
         except ArchiveNotFoundError:
-            logger.info(f"No existing archive found for {url}, attempting to create new archive...")
+            logger.info("No existing archive found for %s, attempting to create new archive...", url)
             raise ArchiveCreationError(
                 "Archive creation is not yet implemented. "
                 "Please try again later when this feature becomes available."
@@ -0,0 +1,136 @@
+"""Concurrent batch archive lookups for archivecli.
+
+This module provides an asyncio/aiohttp based path for resolving many URLs
+against archive.is at once. Lookups are pure I/O wait, so fanning them out
+concurrently (with a semaphore to stay polite to the service) turns the wall
+time for N URLs from N * latency into roughly ceil(N / concurrency) * latency.
+"""
+
+import asyncio
+from typing import List, Union
+
+import aiohttp
+
+from .archive_service import ArchiveService
+from .exceptions import (
+    ArchiveServiceError,
+    ArchiveNotFoundError,
+    ArchiveServiceUnavailableError
+)
+from .logging_config import get_logger
+
+# Module-level logger
+logger = get_logger(__name__)
+
+# Default cap on in-flight requests against archive.is
+DEFAULT_CONCURRENCY = 10
+
+
+async def _fetch_one(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    service: ArchiveService,
+    url: str,
+    timeout: int
+) -> str:
+    """Resolve a single URL against archive.is.
+
+    Args:
+        session: Shared aiohttp client session
+        sem: Semaphore bounding concurrent requests
+        service: ArchiveService used to construct search URLs
+        url: The URL to find archives for
+        timeout: Total request timeout in seconds
+
+    Returns:
+        str: URL of the most recent archive
+
+    Raises:
+        ArchiveServiceError: If there's an error communicating with archive.is
+        ArchiveNotFoundError: If no archive is found for the URL
+    """
+    search_url = service.construct_search_url(url)
+    async with sem:
+        try:
+            async with session.get(
+                search_url,
+                allow_redirects=True,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                final_url = str(response.url)
+                logger.debug("Received status %s for %s", response.status, url)
+
+                # Mirror the status-code handling in ArchiveService.get_latest_archive
+                if response.status == 200:
+                    if 'archive.is/' in final_url and final_url != search_url:
+                        return final_url
+                    raise ArchiveNotFoundError("No archived version found")
+                elif response.status == 404:
+                    raise ArchiveNotFoundError("No archived version found")
+                elif response.status >= 500:
+                    raise ArchiveServiceUnavailableError(
+                        "Archive.is service is temporarily unavailable. Please try again later."
+                    )
+                else:
+                    raise ArchiveServiceError(
+                        f"Received unexpected response from archive.is (status code: {response.status}). "
+                        "Please try again or report this issue if it persists."
+                    )
+        except aiohttp.ClientError as e:
+            raise ArchiveServiceError(f"Failed to communicate with archive.is: {str(e)}")
+        except asyncio.TimeoutError:
+            raise ArchiveServiceError("Failed to communicate with archive.is: request timed out")
+
+
+async def _gather(
+    urls: List[str],
+    concurrency: int,
+    timeout: int
+) -> List[Union[str, Exception]]:
+    """Run archive lookups for all URLs concurrently.
+
+    Args:
+        urls: The URLs to look up
+        concurrency: Maximum number of in-flight requests
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        List[Union[str, Exception]]: One entry per input URL, in order;
+        either the archive URL or the exception that lookup raised.
+    """
+    service = ArchiveService()
+    sem = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(
+        limit=concurrency * 2,
+        limit_per_host=concurrency,
+        ttl_dns_cache=300
+    )
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers=service.headers
+    ) as session:
+        tasks = [_fetch_one(session, sem, service, url, timeout) for url in urls]
+        # return_exceptions so one failed lookup doesn't cancel the batch
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def archive_urls(
+    urls: List[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: int = 10
+) -> List[Union[str, Exception]]:
+    """Look up archived versions of multiple URLs concurrently.
+
+    Args:
+        urls: The URLs to find archives for
+        concurrency: Maximum number of concurrent requests (default: 10)
+        timeout: Per-request timeout in seconds (default: 10)
+
+    Returns:
+        List[Union[str, Exception]]: One entry per input URL, in order;
+        either the archive URL or the exception that lookup raised.
+    """
+    if not urls:
+        return []
+    logger.info("Looking up %d URLs with concurrency %d", len(urls), concurrency)
+    return asyncio.run(_gather(urls, concurrency, timeout))
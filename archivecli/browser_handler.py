@@ -9,10 +9,7 @@ from typing import Tuple
 import logging
 from urllib.parse import urlparse
 
-
-class BrowserError(Exception):
-    """Exception raised for browser-related errors."""
-    pass
+from .exceptions import BrowserError
 
 
 def validate_url(url: str) -> bool:
@@ -24,28 +21,28 @@ def validate_url(url: str) -> bool:
     Returns:
         bool: True if URL is valid, False otherwise
     """
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
-        return False
+    # urlparse doesn't raise for str input; the all() guard is enough
+    result = urlparse(url)
+    return all([result.scheme, result.netloc])
 
 
-def open_url_in_browser(url: str) -> Tuple[bool, str]:
+def open_url_in_browser(url: str, *, trusted: bool = False) -> Tuple[bool, str]:
     """Open the provided URL in the system's default web browser.
-    
+
     Args:
         url: The URL to open in the browser
-        
+        trusted: If True, skip URL validation; for internal callers passing
+            URLs that already came from a validated pipeline
+
     Returns:
         Tuple[bool, str]: A tuple containing:
             - bool: True if successful, False if failed
             - str: Success/error message
-            
+
     Raises:
         BrowserError: If there's an error opening the browser
     """
-    if not validate_url(url):
+    if not trusted and not validate_url(url):
         return False, "Invalid URL format"
     
     try:
@@ -0,0 +1,94 @@
+"""Persistent cache for archive lookups.
+
+This module provides a small SQLite-backed cache mapping target URLs to the
+archive URLs they resolved to. Archive snapshots change rarely, so a cached
+answer within its freshness window saves an entire round trip to archive.is.
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+from .logging_config import get_logger
+
+# Module-level logger
+logger = get_logger(__name__)
+
+# Cached entries are considered fresh for 30 days
+DEFAULT_MAX_AGE = 30 * 86400
+
+
+def default_cache_path() -> Path:
+    """Return the default on-disk location for the lookup cache.
+
+    Returns:
+        Path: Path to the cache database file
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(cache_home) / 'archivecli' / 'cache.sqlite'
+
+
+class ArchiveCache:
+    """SQLite-backed cache of (target URL -> archive URL) lookups."""
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """Initialize the cache, creating the database if needed.
+
+        Args:
+            cache_path: Optional path to the cache database file.
+                Defaults to a per-user cache directory.
+        """
+        path = Path(cache_path) if cache_path else default_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS lookups '
+            '(url TEXT PRIMARY KEY, archive_url TEXT, ts INTEGER)'
+        )
+        self._conn.commit()
+
+    def get(self, url: str, max_age: int = DEFAULT_MAX_AGE) -> Optional[str]:
+        """Look up a cached archive URL for a target URL.
+
+        Args:
+            url: The target URL that was archived
+            max_age: Maximum age in seconds for a cached entry to count as fresh
+
+        Returns:
+            Optional[str]: The cached archive URL, or None on a miss or stale entry
+        """
+        try:
+            row = self._conn.execute(
+                'SELECT archive_url, ts FROM lookups WHERE url = ?', (url,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Cache read failed: %s", e)
+            return None
+        if row is None:
+            return None
+        archive_url, ts = row
+        if time.time() - ts > max_age:
+            logger.debug("Cache entry for %s is stale", url)
+            return None
+        return archive_url
+
+    def put(self, url: str, archive_url: str) -> None:
+        """Store or refresh a cached lookup.
+
+        Args:
+            url: The target URL that was archived
+            archive_url: The archive URL it resolved to
+        """
+        try:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO lookups (url, archive_url, ts) VALUES (?, ?, ?)',
+                (url, archive_url, int(time.time()))
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Cache write failed: %s", e)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -6,12 +6,13 @@ integrating URL validation, archive service, and browser handling components.
 
 import sys
 import argparse
+import functools
 import logging
 from typing import List, Optional
 
-from .validators import validate_url_with_reachability
-from .archive_service import ArchiveService
-from .browser_handler import open_url_in_browser
+# The validators/archive_service/browser_handler imports are deferred into
+# main(): they transitively pull in requests and webbrowser, which --help
+# and --version never need.
 from .exceptions import (
     URLReachabilityError,
     URLValidationError,
@@ -30,9 +31,15 @@ __version__ = "0.1.0"
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser.
 
+    The parser is built once and memoized; argparse allocates hundreds of
+    objects per parser, which repeated in-process invocations (tests, batch
+    runners) shouldn't pay again. Callers must treat the cached parser as
+    read-only.
+
     Returns:
         argparse.ArgumentParser: Configured argument parser
     """
@@ -43,9 +50,16 @@ def create_parser() -> argparse.ArgumentParser:
     
     parser.add_argument(
         "url",
+        nargs="?",
         help="URL to find in archive"
     )
-    
+
+    parser.add_argument(
+        "-b", "--batch",
+        metavar="FILE",
+        help="file containing URLs to look up concurrently, one per line"
+    )
+
     parser.add_argument(
         "-v", "--version",
         action="version",
@@ -71,6 +85,59 @@ def log_message(message: str, level: int = logging.INFO) -> None:
     logger.log(level, message)
 
 
+def _open_cache():
+    """Open the persistent lookup cache, or return None if unavailable.
+
+    Returns:
+        Optional[ArchiveCache]: The cache, or None if it could not be opened
+    """
+    from .cache import ArchiveCache
+
+    try:
+        return ArchiveCache()
+    except Exception as e:
+        logger.warning("Could not open lookup cache, continuing without it: %s", e)
+        return None
+
+
+def run_batch(batch_file: str) -> int:
+    """Look up archives for every URL listed in a file, concurrently.
+
+    Args:
+        batch_file: Path to a file containing one URL per line
+
+    Returns:
+        int: Exit code (0 if every lookup succeeded, 1 if any lookup
+            failed, 2 if the batch file is unreadable or empty)
+    """
+    # Imported here so the single-URL path doesn't pay for aiohttp
+    from .async_archive import archive_urls
+
+    try:
+        with open(batch_file) as f:
+            urls = [line.strip() for line in f if line.strip()]
+    except IOError as e:
+        print(f"Error: Could not read batch file - {str(e)}", file=sys.stderr)
+        return 2
+
+    if not urls:
+        print(f"Error: No URLs found in {batch_file}", file=sys.stderr)
+        return 2
+
+    logger.info("Processing %s URLs from %s", len(urls), batch_file)
+    results = archive_urls(urls)
+
+    failures = 0
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            failures += 1
+            print(f"{url}: error - {str(result)}", file=sys.stderr)
+        else:
+            print(f"{url}: {result}")
+
+    return 0 if failures == 0 else 1
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point for the CLI.
 
@@ -82,28 +149,43 @@ def main(argv: Optional[List[str]] = None) -> int:
     """
     parser = create_parser()
     args = parser.parse_args(argv)
-    
+
     # Configure logging based on quiet flag
     configure_logging(quiet=args.quiet)
-    
+
+    if not args.url and not args.batch:
+        parser.print_usage(sys.stderr)
+        print("Error: a URL or --batch FILE is required", file=sys.stderr)
+        return 2
+
+    if args.batch:
+        return run_batch(args.batch)
+
+    from .validators import ParsedURL, validate_url_with_reachability
+    from .archive_service import ArchiveService
+    from .browser_handler import open_url_in_browser
+    from .http import SESSION
+
     try:
         # Validate URL
-        logger.info(f"Validating URL: {args.url}")
-        validated_url = validate_url_with_reachability(args.url)
-        logger.debug(f"URL validated successfully: {validated_url}")
+        logger.info("Validating URL: %s", args.url)
+        validated_url = validate_url_with_reachability(args.url, session=SESSION)
+        logger.debug("URL validated successfully: %s", validated_url)
         
         # Find archived version
         logger.info("Searching for archived version...")
-        archive_service = ArchiveService()
-        archive_url = archive_service.get_latest_archive(validated_url)
-        logger.debug(f"Found archive URL: {archive_url}")
+        archive_service = ArchiveService(cache=_open_cache())
+        # Parse once here; the service reuses the precomputed encoding
+        archive_url = archive_service.get_latest_archive(ParsedURL.from_url(validated_url))
+        logger.debug("Found archive URL: %s", archive_url)
         
         # Open in browser
-        logger.info(f"Opening archived version: {archive_url}")
-        success, message = open_url_in_browser(archive_url)
+        logger.info("Opening archived version: %s", archive_url)
+        # The archive URL came from archive.is itself, so skip re-validating it
+        success, message = open_url_in_browser(archive_url, trusted=True)
         
         if not success:
-            logger.error(f"Failed to open browser: {message}")
+            logger.error("Failed to open browser: %s", message)
             return 1
         
         logger.info("Operation completed successfully")
@@ -0,0 +1,40 @@
+"""Shared HTTP session for archivecli.
+
+This module owns the single requests.Session used across the process, so the
+validator's reachability probe and the archive service's lookups draw from one
+connection pool, one TLS session cache, and one retry policy instead of each
+component paying for its own connections.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+
+def build_session() -> requests.Session:
+    """Build a session with pooling and transient-failure retries configured.
+
+    Returns:
+        requests.Session: A newly configured session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# The process-wide session shared by validators and the archive service
+SESSION = build_session()
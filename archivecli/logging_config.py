@@ -14,39 +14,54 @@ DEFAULT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 # Module-level logger
 logger = logging.getLogger(__name__)
 
+# Name tagged onto our console handler so repeat configure_logging calls
+# can recognize it instead of rebuilding handlers
+_CONSOLE_HANDLER_NAME = 'archivecli-console'
+
 def configure_logging(quiet: bool = False, log_level: Optional[int] = None) -> None:
     """Configure logging for the entire application.
-    
+
     Args:
         quiet: If True, suppress all non-error output
         log_level: Optional logging level to override default (logging.INFO)
     """
     # Set up the root logger
     root_logger = logging.getLogger('archivecli')
-    
-    # Clear any existing handlers
-    root_logger.handlers.clear()
-    
+
     # Set the base logging level
     if log_level is not None:
         root_logger.setLevel(log_level)
     else:
         root_logger.setLevel(logging.DEBUG if not quiet else logging.ERROR)
-    
+
+    handler_level = logging.ERROR if quiet else logging.INFO
+
+    # If already configured, just refresh the handler level
+    for handler in root_logger.handlers:
+        if handler.name == _CONSOLE_HANDLER_NAME:
+            handler.setLevel(handler_level)
+            return
+
     # Create console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.ERROR if quiet else logging.INFO)
-    
+    console_handler.name = _CONSOLE_HANDLER_NAME
+    console_handler.setLevel(handler_level)
+
     # Create formatter
     formatter = logging.Formatter(
         fmt=DEFAULT_LOG_FORMAT,
         datefmt=DEFAULT_DATE_FORMAT
     )
     console_handler.setFormatter(formatter)
-    
+
     # Add handler to root logger
     root_logger.addHandler(console_handler)
-    
+
+    # Note: logging.logThreads / logProcesses / logMultiprocessing are
+    # deliberately left alone — they're process-global and would strip
+    # thread/process fields from the records of any application embedding
+    # this package
+
     logger.debug('Logging configured: quiet=%s, level=%s', 
                 quiet, 
                 logging.getLevelName(root_logger.level))
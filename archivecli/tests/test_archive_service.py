@@ -32,7 +32,7 @@ def test_get_latest_archive_success(archive_service):
     mock_response.status_code = 200
     mock_response.url = archive_url
     
-    with patch('requests.get', return_value=mock_response) as mock_get:
+    with patch('requests.Session.head', return_value=mock_response) as mock_get:
         result = archive_service.get_latest_archive(test_url)
         assert result == archive_url
         mock_get.assert_called_once()
@@ -47,7 +47,7 @@ def test_get_latest_archive_not_found(archive_service):
     mock_response.status_code = 200
     mock_response.url = search_url
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.head', return_value=mock_response):
         with pytest.raises(ArchiveNotFoundError, match="No archived version found"):
             archive_service.get_latest_archive(test_url)
 
@@ -63,21 +63,42 @@ def test_get_latest_archive_error_status(archive_service, status_code, expected_
     mock_response = Mock()
     mock_response.status_code = status_code
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.head', return_value=mock_response), \
+         patch('requests.Session.get', return_value=mock_response):
         with pytest.raises(expected_error):
             archive_service.get_latest_archive("https://example.com")
 
 
+def test_get_latest_archive_head_fallback_to_get(archive_service):
+    """Test fallback to GET when the server rejects HEAD."""
+    test_url = "https://example.com"
+    archive_url = "https://archive.is/abc123"
+    
+    head_response = Mock()
+    head_response.status_code = 405
+    
+    get_response = Mock()
+    get_response.status_code = 200
+    get_response.url = archive_url
+    
+    with patch('requests.Session.head', return_value=head_response) as mock_head, \
+         patch('requests.Session.get', return_value=get_response) as mock_get:
+        result = archive_service.get_latest_archive(test_url)
+        assert result == archive_url
+        mock_head.assert_called_once()
+        mock_get.assert_called_once()
+
+
 def test_get_latest_archive_request_exception(archive_service):
     """Test handling of request exceptions."""
-    with patch('requests.get', side_effect=RequestException("Connection error")):
+    with patch('requests.Session.head', side_effect=RequestException("Connection error")):
         with pytest.raises(ArchiveServiceError, match="Failed to communicate"):
             archive_service.get_latest_archive("https://example.com")
 
 
 def test_get_latest_archive_timeout(archive_service):
     """Test handling of request timeouts."""
-    with patch('requests.get', side_effect=Timeout("Request timed out")):
+    with patch('requests.Session.head', side_effect=Timeout("Request timed out")):
         with pytest.raises(ArchiveServiceError, match="Failed to communicate"):
             archive_service.get_latest_archive("https://example.com")
 
@@ -91,7 +112,7 @@ def test_get_or_create_archive_existing(archive_service):
     mock_response.status_code = 200
     mock_response.url = archive_url
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.head', return_value=mock_response):
         result = archive_service.get_or_create_archive(test_url)
         assert result == archive_url
 
@@ -102,6 +123,15 @@ def test_get_or_create_archive_not_implemented(archive_service):
     mock_response.status_code = 200
     mock_response.url = archive_service.construct_search_url("https://example.com")
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.head', return_value=mock_response):
         with pytest.raises(ArchiveServiceError, match="not yet implemented"):
-            archive_service.get_or_create_archive("https://example.com")
\ No newline at end of file
+            archive_service.get_or_create_archive("https://example.com")
+
+def test_construct_search_url_with_parsed_url(archive_service):
+    """Test that a ParsedURL's precomputed encoding is used directly."""
+    from archivecli.validators import ParsedURL
+    
+    url = "https://example.com/page"
+    parsed = ParsedURL.from_url(url)
+    assert archive_service.construct_search_url(parsed) == \
+        archive_service.construct_search_url(url)
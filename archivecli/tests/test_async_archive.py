@@ -0,0 +1,115 @@
+"""Tests for the asyncio batch archive lookup path."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from archivecli.async_archive import _fetch_one
+from archivecli.archive_service import ArchiveService
+from archivecli.cli import run_batch
+from archivecli.exceptions import (
+    ArchiveNotFoundError,
+    ArchiveServiceError,
+    ArchiveServiceUnavailableError
+)
+
+
+class MockAiohttpResponse:
+    """Async-context-manager response standing in for aiohttp's."""
+
+    def __init__(self, status, url):
+        self.status = status
+        self.url = url
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class MockAiohttpSession:
+    """Session whose get() hands back a canned response."""
+
+    def __init__(self, response):
+        self._response = response
+
+    def get(self, url, **kwargs):
+        return self._response
+
+
+def fetch(response):
+    """Run _fetch_one against a canned response and return its result."""
+    service = ArchiveService()
+    sem = asyncio.Semaphore(1)
+    return asyncio.run(
+        _fetch_one(MockAiohttpSession(response), sem, service, 'https://example.com', 10)
+    )
+
+
+def test_fetch_one_returns_redirected_archive_url():
+    """Test that a 200 redirected to an archive page yields that URL."""
+    response = MockAiohttpResponse(200, 'https://archive.is/abc123')
+    assert fetch(response) == 'https://archive.is/abc123'
+
+
+def test_fetch_one_without_redirect_raises_not_found():
+    """Test that a 200 still on the search URL means no archive exists."""
+    search_url = ArchiveService().construct_search_url('https://example.com')
+    with pytest.raises(ArchiveNotFoundError):
+        fetch(MockAiohttpResponse(200, search_url))
+
+
+def test_fetch_one_404_raises_not_found():
+    """Test that a 404 maps to ArchiveNotFoundError."""
+    with pytest.raises(ArchiveNotFoundError):
+        fetch(MockAiohttpResponse(404, 'https://archive.is/x'))
+
+
+def test_fetch_one_5xx_raises_unavailable():
+    """Test that a 5xx maps to ArchiveServiceUnavailableError."""
+    with pytest.raises(ArchiveServiceUnavailableError):
+        fetch(MockAiohttpResponse(503, 'https://archive.is/x'))
+
+
+def test_fetch_one_unexpected_status_raises_service_error():
+    """Test that any other status maps to ArchiveServiceError."""
+    with pytest.raises(ArchiveServiceError):
+        fetch(MockAiohttpResponse(418, 'https://archive.is/x'))
+
+
+@pytest.fixture
+def batch_file(tmp_path):
+    path = tmp_path / "urls.txt"
+    path.write_text("https://example.com\nhttps://example.org\n")
+    return str(path)
+
+
+def test_run_batch_all_successful(batch_file):
+    """Test that a fully successful batch exits 0."""
+    with patch('archivecli.async_archive.archive_urls') as mock_lookup:
+        mock_lookup.return_value = ['https://archive.is/a', 'https://archive.is/b']
+        assert run_batch(batch_file) == 0
+    mock_lookup.assert_called_once_with(['https://example.com', 'https://example.org'])
+
+
+def test_run_batch_partial_failure(batch_file):
+    """Test that any failed lookup makes the batch exit 1."""
+    with patch('archivecli.async_archive.archive_urls') as mock_lookup:
+        mock_lookup.return_value = [
+            'https://archive.is/a',
+            ArchiveNotFoundError('No archived version found')
+        ]
+        assert run_batch(batch_file) == 1
+
+
+def test_run_batch_unreadable_file(tmp_path):
+    """Test that a missing batch file exits 2."""
+    assert run_batch(str(tmp_path / "missing.txt")) == 2
+
+
+def test_run_batch_empty_file(tmp_path):
+    """Test that a batch file with no URLs exits 2."""
+    path = tmp_path / "empty.txt"
+    path.write_text("\n   \n")
+    assert run_batch(str(path)) == 2
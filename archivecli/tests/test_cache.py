@@ -0,0 +1,75 @@
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from archivecli.archive_service import ArchiveService
+from archivecli.cache import ArchiveCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an ArchiveCache backed by a temporary database."""
+    return ArchiveCache(str(tmp_path / "cache.sqlite"))
+
+
+def test_get_miss(cache):
+    """Test that an unknown URL is a cache miss."""
+    assert cache.get("https://example.com") is None
+
+
+def test_put_and_get(cache):
+    """Test storing and retrieving a lookup."""
+    cache.put("https://example.com", "https://archive.is/abc123")
+    assert cache.get("https://example.com") == "https://archive.is/abc123"
+
+
+def test_put_replaces_existing(cache):
+    """Test that storing the same URL twice keeps the newer archive URL."""
+    cache.put("https://example.com", "https://archive.is/old")
+    cache.put("https://example.com", "https://archive.is/new")
+    assert cache.get("https://example.com") == "https://archive.is/new"
+
+
+def test_stale_entry_is_miss(cache):
+    """Test that entries older than max_age are treated as misses."""
+    cache.put("https://example.com", "https://archive.is/abc123")
+    with patch("archivecli.cache.time.time", return_value=time.time() + 31 * 86400):
+        assert cache.get("https://example.com") is None
+
+
+def test_persistence_across_instances(tmp_path):
+    """Test that cached lookups survive reopening the database."""
+    path = str(tmp_path / "cache.sqlite")
+    first = ArchiveCache(path)
+    first.put("https://example.com", "https://archive.is/abc123")
+    first.close()
+
+    second = ArchiveCache(path)
+    assert second.get("https://example.com") == "https://archive.is/abc123"
+
+
+def test_service_returns_cached_archive(cache):
+    """Test that ArchiveService serves cache hits without a request."""
+    cache.put("https://example.com", "https://archive.is/abc123")
+    service = ArchiveService(cache=cache)
+
+    with patch("requests.Session.head") as mock_head:
+        result = service.get_latest_archive("https://example.com")
+        assert result == "https://archive.is/abc123"
+        mock_head.assert_not_called()
+
+
+def test_service_writes_back_on_success(cache):
+    """Test that ArchiveService caches a freshly resolved archive URL."""
+    service = ArchiveService(cache=cache)
+    archive_url = "https://archive.is/abc123"
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.url = archive_url
+
+    with patch("requests.Session.head", return_value=mock_response):
+        assert service.get_latest_archive("https://example.com") == archive_url
+
+    assert cache.get("https://example.com") == archive_url
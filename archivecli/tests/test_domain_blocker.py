@@ -1,28 +1,33 @@
 import pytest
 import json
-import tempfile
 from pathlib import Path
 
 from archivecli.domain_blocker import DomainBlocker, DomainBlockerError
 
 
+@pytest.fixture(scope="session")
+def shared_domain_blocker():
+    """Create a DomainBlocker shared by read-only tests."""
+    return DomainBlocker()
+
+
 @pytest.fixture
 def domain_blocker():
-    """Create a DomainBlocker instance for testing."""
+    """Create a fresh DomainBlocker for tests that mutate the blocklist."""
     return DomainBlocker()
 
 
-@pytest.fixture
-def temp_config_file():
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory):
     """Create a temporary configuration file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump({'blocked_domains': ['test.com', 'example.org']}, f)
-        return Path(f.name)
+    path = tmp_path_factory.mktemp("config") / "blocked.json"
+    path.write_text(json.dumps({'blocked_domains': ['test.com', 'example.org']}))
+    return path
 
 
-def test_default_blocked_domains(domain_blocker):
+def test_default_blocked_domains(shared_domain_blocker):
     """Test that default blocked domains are loaded."""
-    blocked_domains = domain_blocker.get_blocked_domains()
+    blocked_domains = shared_domain_blocker.get_blocked_domains()
     assert 'facebook.com' in blocked_domains
     assert 'twitter.com' in blocked_domains
 
@@ -41,17 +46,17 @@ def test_load_config_invalid_file():
         DomainBlocker("nonexistent.json")
 
 
-def test_is_domain_blocked(domain_blocker):
+def test_is_domain_blocked(shared_domain_blocker):
     """Test checking if domains are blocked."""
-    assert domain_blocker.is_domain_blocked("https://www.facebook.com/path")
-    assert domain_blocker.is_domain_blocked("http://twitter.com")
-    assert not domain_blocker.is_domain_blocked("https://example.com")
+    assert shared_domain_blocker.is_domain_blocked("https://www.facebook.com/path")
+    assert shared_domain_blocker.is_domain_blocked("http://twitter.com")
+    assert not shared_domain_blocker.is_domain_blocked("https://example.com")
 
 
-def test_is_domain_blocked_with_www(domain_blocker):
+def test_is_domain_blocked_with_www(shared_domain_blocker):
     """Test that www prefix is handled correctly."""
-    assert domain_blocker.is_domain_blocked("https://www.facebook.com")
-    assert domain_blocker.is_domain_blocked("https://facebook.com")
+    assert shared_domain_blocker.is_domain_blocked("https://www.facebook.com")
+    assert shared_domain_blocker.is_domain_blocked("https://facebook.com")
 
 
 def test_add_blocked_domain(domain_blocker):
@@ -69,23 +74,23 @@ def test_remove_blocked_domain(domain_blocker):
     assert domain not in domain_blocker.get_blocked_domains()
 
 
-def test_remove_nonexistent_domain(domain_blocker):
+def test_remove_nonexistent_domain(shared_domain_blocker):
     """Test removing a domain that isn't blocked."""
     with pytest.raises(DomainBlockerError, match="not in the blocked list"):
-        domain_blocker.remove_blocked_domain("nonexistent.com")
+        shared_domain_blocker.remove_blocked_domain("nonexistent.com")
 
 
-def test_save_config(domain_blocker, tmp_path):
+def test_save_config(shared_domain_blocker, tmp_path):
     """Test saving configuration to file."""
     config_path = tmp_path / "config.json"
-    domain_blocker.save_config(str(config_path))
+    shared_domain_blocker.save_config(str(config_path))
     
     # Verify file contents
     with open(config_path) as f:
         config = json.load(f)
         assert 'blocked_domains' in config
         assert isinstance(config['blocked_domains'], list)
-        assert set(config['blocked_domains']) == domain_blocker.get_blocked_domains()
+        assert set(config['blocked_domains']) == shared_domain_blocker.get_blocked_domains()
 
 
 def test_case_insensitive_domains(domain_blocker):
@@ -95,7 +100,93 @@ def test_case_insensitive_domains(domain_blocker):
     assert domain_blocker.is_domain_blocked("https://EXAMPLE.COM")
 
 
-def test_invalid_url_format(domain_blocker):
+def test_invalid_url_format(shared_domain_blocker):
     """Test handling of invalid URL formats."""
     with pytest.raises(DomainBlockerError, match="Failed to parse URL"):
-        domain_blocker.is_domain_blocked("not-a-valid-url")
\ No newline at end of file
+        shared_domain_blocker.is_domain_blocked("not-a-valid-url")
+
+def test_load_config_prunes_redundant_subdomains(tmp_path):
+    """Test that entries covered by a broader blocked domain are pruned."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(
+        {'blocked_domains': ['test.com', 'sub.test.com']}
+    ))
+    blocker = DomainBlocker(str(config_path))
+
+    blocked_domains = blocker.get_blocked_domains()
+    assert 'test.com' in blocked_domains
+    assert 'sub.test.com' not in blocked_domains
+    # Matching is unchanged: the subdomain is still covered
+    assert blocker.is_domain_blocked("https://sub.test.com")
+
+
+def test_load_config_uses_compiled_cache(tmp_path):
+    """Test that a fresh pickle cache is written and then preferred."""
+    import pickle
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({'blocked_domains': ['test.com']}))
+
+    DomainBlocker(str(config_path))
+    cache_path = tmp_path / "config.json.pkl"
+    assert cache_path.exists()
+
+    # A second load should read the cache, not re-parse the JSON
+    with open(cache_path, 'wb') as f:
+        pickle.dump(frozenset({'cached-only.com'}), f)
+    blocker = DomainBlocker(str(config_path))
+    assert 'cached-only.com' in blocker.get_blocked_domains()
+
+
+def test_bloom_front_gate_matches_plain_path(domain_blocker, monkeypatch):
+    """Test that the Bloom-gated path agrees with plain set probing."""
+    from archivecli import domain_blocker as db_module
+
+    monkeypatch.setattr(db_module, '_BLOOM_THRESHOLD', 5)
+    monkeypatch.setattr(db_module, 'ahocorasick', None)
+
+    assert domain_blocker.is_domain_blocked("https://www.facebook.com")
+    assert domain_blocker.is_domain_blocked("https://sub.twitter.com")
+    assert not domain_blocker.is_domain_blocked("https://example.org")
+    # The gate was actually built for this blocklist size
+    assert domain_blocker._bloom is not None
+
+
+def test_automaton_path_matches_plain_path(domain_blocker, monkeypatch):
+    """Test that the Aho-Corasick path agrees with plain set probing."""
+    pytest.importorskip("ahocorasick")
+    from archivecli import domain_blocker as db_module
+
+    monkeypatch.setattr(db_module, '_AUTOMATON_THRESHOLD', 5)
+    domain_blocker.add_blocked_domain('test.com')
+
+    assert domain_blocker.is_domain_blocked("https://www.facebook.com")
+    assert domain_blocker.is_domain_blocked("https://sub.test.com")
+    # Suffix matches must be label-anchored: notatest.com is not test.com
+    assert not domain_blocker.is_domain_blocked("https://notatest.com")
+    assert not domain_blocker.is_domain_blocked("https://example.org")
+    # The automaton path was actually taken for this blocklist size
+    assert domain_blocker._automaton is not None
+
+
+def test_compiled_cache_holds_only_that_configs_entries(tmp_path):
+    """Test that a config's cache never absorbs state from other loads."""
+    import pickle
+
+    config1 = tmp_path / "config1.json"
+    config1.write_text(json.dumps({'blocked_domains': ['alpha.com']}))
+    config2 = tmp_path / "config2.json"
+    config2.write_text(json.dumps({'blocked_domains': ['beta.com']}))
+
+    blocker = DomainBlocker(str(config1))
+    blocker.load_config(str(config2))
+
+    with open(tmp_path / "config2.json.pkl", 'rb') as f:
+        cached = pickle.load(f)
+    assert cached == frozenset({'beta.com'})
+
+    # A fresh blocker on config2 (served from cache) must not inherit
+    # config1's domains
+    fresh = DomainBlocker(str(config2))
+    assert not fresh.is_domain_blocked("https://alpha.com")
+    assert fresh.is_domain_blocked("https://beta.com")
@@ -1,19 +1,27 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from archivecli.cli import main
-from archivecli.validators import URLValidationError, URLReachabilityError
+from archivecli.validators import ParsedURL, URLValidationError, URLReachabilityError
 from archivecli.archive_service import ArchiveNotFoundError, ArchiveServiceError
 from archivecli.browser_handler import BrowserError
+from archivecli.http import SESSION
+
+@pytest.fixture(autouse=True)
+def no_disk_cache():
+    """Keep main() from creating the real on-disk lookup cache during tests."""
+    with patch('archivecli.cli._open_cache', return_value=None):
+        yield
+
 
 @pytest.fixture
 def mock_validate_url():
-    with patch('archivecli.cli.validate_url_with_reachability') as mock:
+    with patch('archivecli.validators.validate_url_with_reachability') as mock:
         mock.return_value = 'https://example.com'
         yield mock
 
 @pytest.fixture
 def mock_archive_service():
-    with patch('archivecli.cli.ArchiveService') as mock_class:
+    with patch('archivecli.archive_service.ArchiveService') as mock_class:
         mock_instance = MagicMock()
         mock_class.return_value = mock_instance
         mock_instance.get_latest_archive.return_value = 'https://archive.is/abc123'
@@ -21,7 +29,7 @@ def mock_archive_service():
 
 @pytest.fixture
 def mock_browser():
-    with patch('archivecli.cli.open_url_in_browser') as mock:
+    with patch('archivecli.browser_handler.open_url_in_browser') as mock:
         mock.return_value = (True, 'Success')
         yield mock
 
@@ -30,9 +38,11 @@ def test_successful_workflow(mock_validate_url, mock_archive_service, mock_brows
     result = main(['https://example.com'])
     
     # Verify each step was called correctly
-    mock_validate_url.assert_called_once_with('https://example.com')
-    mock_archive_service.get_latest_archive.assert_called_once_with('https://example.com')
-    mock_browser.assert_called_once_with('https://archive.is/abc123')
+    mock_validate_url.assert_called_once_with('https://example.com', session=SESSION)
+    mock_archive_service.get_latest_archive.assert_called_once_with(
+        ParsedURL.from_url('https://example.com')
+    )
+    mock_browser.assert_called_once_with('https://archive.is/abc123', trusted=True)
     
     # Verify successful exit code
     assert result == 0
@@ -43,7 +53,7 @@ def test_invalid_url(mock_validate_url, mock_archive_service, mock_browser):
     
     result = main(['http://invalid'])
     
-    mock_validate_url.assert_called_once_with('http://invalid')
+    mock_validate_url.assert_called_once_with('http://invalid', session=SESSION)
     mock_archive_service.get_latest_archive.assert_not_called()
     mock_browser.assert_not_called()
     
@@ -55,7 +65,7 @@ def test_unreachable_url(mock_validate_url, mock_archive_service, mock_browser):
     
     result = main(['https://unreachable.com'])
     
-    mock_validate_url.assert_called_once_with('https://unreachable.com')
+    mock_validate_url.assert_called_once_with('https://unreachable.com', session=SESSION)
     mock_archive_service.get_latest_archive.assert_not_called()
     mock_browser.assert_not_called()
     
@@ -67,8 +77,10 @@ def test_no_archive_found(mock_validate_url, mock_archive_service, mock_browser)
     
     result = main(['https://example.com'])
     
-    mock_validate_url.assert_called_once_with('https://example.com')
-    mock_archive_service.get_latest_archive.assert_called_once_with('https://example.com')
+    mock_validate_url.assert_called_once_with('https://example.com', session=SESSION)
+    mock_archive_service.get_latest_archive.assert_called_once_with(
+        ParsedURL.from_url('https://example.com')
+    )
     mock_browser.assert_not_called()
     
     assert result == 4
@@ -79,8 +91,10 @@ def test_archive_service_error(mock_validate_url, mock_archive_service, mock_bro
     
     result = main(['https://example.com'])
     
-    mock_validate_url.assert_called_once_with('https://example.com')
-    mock_archive_service.get_latest_archive.assert_called_once_with('https://example.com')
+    mock_validate_url.assert_called_once_with('https://example.com', session=SESSION)
+    mock_archive_service.get_latest_archive.assert_called_once_with(
+        ParsedURL.from_url('https://example.com')
+    )
     mock_browser.assert_not_called()
     
     assert result == 7
@@ -91,9 +105,11 @@ def test_browser_error(mock_validate_url, mock_archive_service, mock_browser):
     
     result = main(['https://example.com'])
     
-    mock_validate_url.assert_called_once_with('https://example.com')
-    mock_archive_service.get_latest_archive.assert_called_once_with('https://example.com')
-    mock_browser.assert_called_once_with('https://archive.is/abc123')
+    mock_validate_url.assert_called_once_with('https://example.com', session=SESSION)
+    mock_archive_service.get_latest_archive.assert_called_once_with(
+        ParsedURL.from_url('https://example.com')
+    )
+    mock_browser.assert_called_once_with('https://archive.is/abc123', trusted=True)
     
     assert result == 8
 
@@ -106,8 +122,10 @@ def test_quiet_mode(mock_validate_url, mock_archive_service, mock_browser):
     """Test quiet mode operation."""
     result = main(['--quiet', 'https://example.com'])
     
-    mock_validate_url.assert_called_once_with('https://example.com')
-    mock_archive_service.get_latest_archive.assert_called_once_with('https://example.com')
-    mock_browser.assert_called_once_with('https://archive.is/abc123')
+    mock_validate_url.assert_called_once_with('https://example.com', session=SESSION)
+    mock_archive_service.get_latest_archive.assert_called_once_with(
+        ParsedURL.from_url('https://example.com')
+    )
+    mock_browser.assert_called_once_with('https://archive.is/abc123', trusted=True)
     
     assert result == 0
\ No newline at end of file
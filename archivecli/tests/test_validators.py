@@ -11,19 +11,23 @@ from archivecli.validators import (
 
 # ... (keep existing validation tests) ...
 
-@pytest.fixture
+class MockResponse:
+    """Minimal response stand-in shared across tests."""
+
+    def __init__(self, status_code=200, url=None):
+        self.status_code = status_code
+        self.url = url or "https://example.com"
+
+
+@pytest.fixture(scope="module")
 def mock_response():
-    """Create a mock response object."""
-    class MockResponse:
-        def __init__(self, status_code=200, url=None):
-            self.status_code = status_code
-            self.url = url or "https://example.com"
+    """Provide the shared MockResponse class."""
     return MockResponse
 
 
 def test_successful_reachability(mock_response):
     """Test successful URL reachability check."""
-    with patch('requests.head') as mock_head:
+    with patch('requests.Session.head') as mock_head:
         mock_head.return_value = mock_response()
         url, reachable = check_url_reachability("https://example.com")
         assert reachable
@@ -32,7 +36,7 @@ def test_successful_reachability(mock_response):
 
 def test_redirect_handling(mock_response):
     """Test handling of redirected URLs."""
-    with patch('requests.head') as mock_head:
+    with patch('requests.Session.head') as mock_head:
         final_url = "https://example.com/final"
         mock_head.return_value = mock_response(url=final_url)
         url, reachable = check_url_reachability("https://example.com")
@@ -48,7 +52,7 @@ def test_redirect_handling(mock_response):
 ])
 def test_error_status_codes(mock_response, status_code, expected_error):
     """Test handling of various HTTP error status codes."""
-    with patch('requests.head') as mock_head:
+    with patch('requests.Session.head') as mock_head:
         mock_head.return_value = mock_response(status_code=status_code)
         with pytest.raises(URLReachabilityError, match=expected_error):
             check_url_reachability("https://example.com")
@@ -62,7 +66,7 @@ def test_error_status_codes(mock_response, status_code, expected_error):
 ])
 def test_request_exceptions(exception, expected_error):
     """Test handling of various request exceptions."""
-    with patch('requests.head') as mock_head:
+    with patch('requests.Session.head') as mock_head:
         mock_head.side_effect = exception
         with pytest.raises(URLReachabilityError, match=expected_error):
             check_url_reachability("https://example.com")
@@ -70,15 +74,32 @@ def test_request_exceptions(exception, expected_error):
 
 def test_validate_url_with_reachability_success():
     """Test successful complete URL validation with reachability."""
-    with patch('requests.head') as mock_head:
-        mock_head.return_value = mock_response()
+    with patch('requests.Session.head') as mock_head:
+        mock_head.return_value = MockResponse()
         result = validate_url_with_reachability("https://example.com")
         assert result == "https://example.com"
 
 
 def test_validate_url_with_reachability_timeout():
     """Test timeout handling in complete validation."""
-    with patch('requests.head') as mock_head:
+    with patch('requests.Session.head') as mock_head:
         mock_head.side_effect = Timeout
         with pytest.raises(URLReachabilityError, match="Request timed out"):
-            validate_url_with_reachability("https://example.com", timeout=5)
\ No newline at end of file
+            validate_url_with_reachability("https://example.com", timeout=5)
+
+def test_check_urls_reachability_mixed_results():
+    """Test concurrent batch checks return per-URL results in order."""
+    from archivecli.validators import check_urls_reachability
+
+    def fake_head(self, url, **kwargs):
+        response = type('R', (), {})()
+        response.url = url
+        response.status_code = 404 if 'missing' in url else 200
+        return response
+
+    urls = ["https://example.com", "https://example.com/missing"]
+    with patch('requests.Session.head', fake_head):
+        results = check_urls_reachability(urls)
+
+    assert results[0] == ("https://example.com", True)
+    assert isinstance(results[1], URLReachabilityError)
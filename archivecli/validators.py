@@ -1,18 +1,77 @@
-from urllib.parse import urlparse
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import quote, urlsplit
+from typing import List, NamedTuple, Optional, Tuple, Union
 import requests
 from requests.exceptions import RequestException
 from .domain_blocker import DomainBlocker, DomainBlockerError
+from .exceptions import URLValidationError, URLReachabilityError
+from .http import SESSION as _SESSION
 
 
-class URLValidationError(Exception):
-    """Custom exception for URL validation errors."""
-    pass
+@lru_cache(maxsize=4096)
+def _parse(url: str):
+    """Parse a URL, memoizing the result for repeated validations.
 
+    A single validation flow touches the same URL several times (scheme
+    check, well-formedness, domain blocking); caching makes every call
+    after the first a hash probe instead of a re-parse.
 
-class URLReachabilityError(Exception):
-    """Custom exception for URL reachability errors."""
-    pass
+    Args:
+        url: The URL to parse
+
+    Returns:
+        SplitResult: The parsed URL
+    """
+    # urlsplit skips the params component urlparse would also split out;
+    # nothing here reads it
+    return urlsplit(url)
+
+
+class ParsedURL(NamedTuple):
+    """A URL parsed exactly once and carried through the pipeline.
+
+    Downstream consumers (domain blocking, search-URL construction) read the
+    precomputed fields instead of re-running urlparse and quote on the same
+    string at every layer.
+    """
+
+    raw: str
+    scheme: str
+    netloc: str
+    hostname: str
+    path: str
+    encoded_submit: str
+
+    @classmethod
+    def from_url(cls, url: str) -> "ParsedURL":
+        """Parse a URL string into its reusable components.
+
+        Args:
+            url: The URL to parse
+
+        Returns:
+            ParsedURL: The parsed URL with the submit-encoding precomputed
+        """
+        parsed = _parse(url)
+        return cls(
+            raw=url,
+            scheme=parsed.scheme,
+            netloc=parsed.netloc,
+            # Lowercased and stripped of port/userinfo, so domain checks
+            # can use it directly
+            hostname=parsed.hostname or '',
+            path=parsed.path,
+            encoded_submit=quote(url, safe='')
+        )
+
+
+# Error messages for specific reachability status codes; 5xx and anything
+# else unexpected are handled as buckets in check_url_reachability
+_STATUS_ERRORS = {
+    403: "Access forbidden",
+    404: "Page not found",
+}
 
 
 def is_valid_scheme(url: str) -> bool:
@@ -26,7 +85,7 @@ def is_valid_scheme(url: str) -> bool:
         bool: True if the URL has a valid scheme, False otherwise
     """
     try:
-        parsed = urlparse(url)
+        parsed = _parse(url)
         return parsed.scheme in ('http', 'https')
     except Exception:
         return False
@@ -43,28 +102,36 @@ def is_well_formed_url(url: str) -> bool:
         bool: True if the URL is well-formed, False otherwise
     """
     try:
-        result = urlparse(url)
+        result = _parse(url)
         return all([result.scheme, result.netloc])
     except Exception:
         return False
 
 
-def check_url_reachability(url: str, timeout: int = 10) -> Tuple[str, bool]:
+def check_url_reachability(
+    url: str,
+    timeout: int = 10,
+    session: Optional[requests.Session] = None
+) -> Tuple[str, bool]:
     """
     Check if a URL is reachable and follow redirects if necessary.
-    
+
     Args:
         url: The URL to check
         timeout: Timeout in seconds for the request
-        
+        session: Optional session to issue the request through; defaults to
+            the process-wide pooled session so repeated probes reuse
+            keep-alive connections
+
     Returns:
         Tuple[str, bool]: (Final URL after redirects, True if reachable)
-        
+
     Raises:
         URLReachabilityError: If the URL is unreachable or encounters an error
     """
+    requester = session if session is not None else _SESSION
     try:
-        response = requests.head(
+        response = requester.head(
             url,
             allow_redirects=True,
             timeout=timeout,
@@ -73,18 +140,16 @@ def check_url_reachability(url: str, timeout: int = 10) -> Tuple[str, bool]:
         
         # Check if we got redirected
         final_url = response.url
-        
-        # Handle common status codes
-        if response.status_code == 200:
+
+        # Handle common status codes via O(1) table dispatch
+        status_code = response.status_code
+        if status_code == 200:
             return final_url, True
-        elif response.status_code == 403:
-            raise URLReachabilityError("Access forbidden")
-        elif response.status_code == 404:
-            raise URLReachabilityError("Page not found")
-        elif response.status_code >= 500:
-            raise URLReachabilityError("Server error occurred")
-        else:
-            raise URLReachabilityError(f"Unexpected status code: {response.status_code}")
+        message = _STATUS_ERRORS.get(status_code) or (
+            "Server error occurred" if status_code >= 500
+            else f"Unexpected status code: {status_code}"
+        )
+        raise URLReachabilityError(message)
             
     except requests.exceptions.Timeout:
         raise URLReachabilityError("Request timed out")
@@ -96,9 +161,52 @@ def check_url_reachability(url: str, timeout: int = 10) -> Tuple[str, bool]:
         raise URLReachabilityError(f"Request failed: {str(e)}")
 
 
-def validate_url_with_reachability(url: str, timeout: int = 10, domain_blocker: Optional[DomainBlocker] = None) -> str:
+def check_urls_reachability(
+    urls: List[str],
+    timeout: int = 10,
+    max_workers: int = 32
+) -> List[Union[Tuple[str, bool], URLReachabilityError]]:
+    """Check many URLs for reachability concurrently.
+
+    The probes are pure network wait, so fanning them out over a thread
+    pool (all sharing the pooled session) turns N serial round trips into
+    roughly ceil(N / workers) of wall time.
+
+    Args:
+        urls: The URLs to check
+        timeout: Timeout in seconds for each request
+        max_workers: Maximum number of concurrent probes
+
+    Returns:
+        List[Union[Tuple[str, bool], URLReachabilityError]]: One entry per
+        input URL, in order; either the (final URL, reachable) tuple or the
+        URLReachabilityError that probe raised.
+    """
+    if not urls:
+        return []
+
+    def probe(url: str):
+        try:
+            return check_url_reachability(url, timeout)
+        except URLReachabilityError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(probe, urls))
+
+
+def validate_url_with_reachability(
+    url: str,
+    timeout: int = 10,
+    domain_blocker: Optional[DomainBlocker] = None,
+    session: Optional[requests.Session] = None
+) -> str:
     """Perform complete URL validation including reachability check and domain blocking.
-    
+
+    Deliberately not memoized: the result depends on live state (origin
+    reachability, the blocker's current list), so caching it would let
+    stale verdicts outlive blocklist updates.
+
     Args:
         url: The URL to validate
         timeout: Timeout in seconds for the request
@@ -112,16 +220,24 @@ def validate_url_with_reachability(url: str, timeout: int = 10, domain_blocker:
         URLReachabilityError: If the URL is unreachable
         DomainBlockerError: If the domain is blocked or there's an error checking the domain
     """
-    if not is_well_formed_url(url):
-        raise URLValidationError("Invalid URL format")
-        
-    if not is_valid_scheme(url):
+    # Cheap prefix test rejects obviously invalid URLs before any parsing;
+    # it also covers the scheme check. Lowercase only the prefix — schemes
+    # are case-insensitive per RFC 3986
+    if not url[:8].lower().startswith(('http://', 'https://')):
         raise URLValidationError("URL must start with http:// or https://")
-    
-    if domain_blocker and domain_blocker.is_domain_blocked(url):
+
+    # One parse covers well-formedness and domain blocking
+    parsed = _parse(url)
+
+    if not parsed.netloc:
+        raise URLValidationError("Invalid URL format")
+
+    # Blocked domains are rejected before any network round trip; hostname
+    # (not netloc) so userinfo and ports never reach the exact-match probes
+    if domain_blocker and domain_blocker.is_host_blocked(parsed.hostname or ''):
         raise URLValidationError("Domain is blocked")
         
-    final_url, reachable = check_url_reachability(url, timeout)
+    final_url, reachable = check_url_reachability(url, timeout, session=session)
     return final_url
 
 
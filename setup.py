@@ -1,5 +1,19 @@
 import os
-from setuptools import setup, find_packages
+from setuptools import setup
+
+# Opt-in ahead-of-time compilation of the hot-path modules. Guarded by an
+# environment flag so plain installs never require a C toolchain; the
+# pure-Python modules remain the fallback everywhere else.
+ext_modules = []
+if os.environ.get("ARCHIVECLI_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+        ext_modules = mypycify([
+            "archivecli/validators.py",
+            "archivecli/domain_blocker.py",
+        ])
+    except ImportError:
+        pass
 
 # Read version from package __init__.py
 def get_version():
@@ -17,13 +31,24 @@ with open("README.md", "r", encoding="utf-8") as fh:
 setup(
     name="archivecli",
     version=get_version(),
-    packages=find_packages(exclude=["tests*"]),
+    # Explicit listing skips find_packages' filesystem walk at build time
+    packages=["archivecli", "archivecli.tests"],
+    ext_modules=ext_modules,
     install_requires=[
         "requests>=2.28.0",
         "click>=8.0.0",
         "urllib3>=2.0.0",
-        "certifi>=2023.7.22"
+        "certifi>=2023.7.22",
+        "aiohttp>=3.8.0"
     ],
+    extras_require={
+        # Optional accelerators picked up automatically when installed
+        "speed": [
+            "pyahocorasick>=2.0.0",
+            "ada-url>=1.0.0",
+            "orjson>=3.8.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "archive=archivecli.cli:main",
@@ -57,5 +82,7 @@ setup(
     python_requires=">=3.8",
     keywords="archive web-archive cli url-archiver archive.is",
     include_package_data=True,
-    zip_safe=False,
+    # Nothing reads package-relative data at import time (the blocklist
+    # loader takes an explicit path), so zipimport is safe
+    zip_safe=True,
 )
\ No newline at end of file